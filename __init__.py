@@ -11,6 +11,16 @@ bl_info = {
 import bpy
 import math
 import random
+import colorsys
+import json
+import sys
+import os
+import array
+import hashlib
+import shutil
+import subprocess
+import tempfile
+import bpy.utils.previews
 from mathutils import Vector, Color
 
 # ------------------------------------------------------------------------
@@ -33,13 +43,23 @@ def get_or_create_collection(name=COLLECTION_NAME):
         bpy.context.scene.collection.children.link(col)
     return col
 
-def get_lighting_target(context):
+def find_lighting_target(context):
+    """Same lookup as get_lighting_target, but returns None instead of creating the target null."""
     props = context.scene.octane_studio_props
     if props.target_object: return props.target_object
     if "Studio_Target_Null" in bpy.data.objects: return bpy.data.objects["Studio_Target_Null"]
-    
+    # An existing rig already knows its subject (the last built light is the active object)
+    key = find_light_object('KEY')
+    if key:
+        for c in key.constraints:
+            if c.type == 'TRACK_TO' and c.target: return c.target
     obj = context.active_object
-    if not obj or "Studio_" in obj.name or obj.type == 'LIGHT' or obj.type == 'CAMERA':
+    if not obj or "Studio_" in obj.name or obj.type == 'LIGHT' or obj.type == 'CAMERA': return None
+    return obj
+
+def get_lighting_target(context):
+    obj = find_lighting_target(context)
+    if not obj:
         if bpy.ops.object.select_all.poll(): bpy.ops.object.select_all(action='DESELECT')
         bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0,0,1.6))
         obj = context.active_object
@@ -229,6 +249,101 @@ def update_camera_transform(self, context):
         cam_data.dof.focus_object = None
         cam_data.dof.focus_distance = props.camera_focus_distance 
 
+# ------------------------------------------------------------------------
+#   RENDER COST ESTIMATE
+# ------------------------------------------------------------------------
+
+# Relative cost per feature unit. The score is unitless; cost_seconds_per_unit
+# (fitted from real render timings) turns it into an estimated render time.
+COST_WEIGHTS = {
+    'lights': 1.0,              # per enabled area light
+    'light_area': 0.25,         # per m^2 of emitter surface (soft lights sample more)
+    'camera_visible': 0.5,      # per light visible to camera
+    'fog': 10.0,                # per (density * 1000 m^3) of scatter medium
+    'bokeh': 0.05,              # per bokeh emitter
+    'bokeh_emission': 0.002,    # per (power * m^2) of bokeh emission
+}
+COST_BASE = 1.0
+BYTES_PER_VERT = 64
+BYTES_PER_POLY = 48
+BYTES_PER_OBJECT = 2048
+
+def collect_cost_features(scene):
+    """Walks the add-on owned objects and returns the raw inputs of the cost model."""
+    f = {k: 0.0 for k in COST_WEIGHTS}
+    mem = 0
+    col = bpy.data.collections.get(COLLECTION_NAME)
+    if col:
+        for obj in col.objects:
+            if obj.hide_render: continue
+            mem += BYTES_PER_OBJECT
+            if obj.type == 'LIGHT' and obj.get("studio_role"):
+                f['lights'] += 1
+                if obj.data.type == 'AREA': f['light_area'] += obj.data.size * obj.data.size_y
+                if hasattr(obj, 'octane') and getattr(obj.octane, 'camera_visibility', False):
+                    f['camera_visible'] += 1
+            elif obj.type == 'MESH':
+                mem += len(obj.data.vertices) * BYTES_PER_VERT + len(obj.data.polygons) * BYTES_PER_POLY
+                if obj.name.startswith("Octane_Atmosphere"):
+                    d = obj.dimensions
+                    f['fog'] += scene.octane_studio_props.creative.atmos_density * d.x * d.y * d.z / 1000.0
+
+    bokeh_col = bpy.data.collections.get(BOKEH_COLLECTION_NAME)
+    if bokeh_col:
+        power = scene.octane_studio_props.creative.bokeh_power
+        meshes = set()
+        for obj in bokeh_col.objects:
+            if obj.hide_render or obj.type != 'MESH': continue
+            f['bokeh'] += 1
+            r = max(obj.scale)
+            f['bokeh_emission'] += power * 4.0 * math.pi * r * r
+            mem += BYTES_PER_OBJECT
+            if obj.data.name not in meshes:
+                meshes.add(obj.data.name)
+                mem += len(obj.data.vertices) * BYTES_PER_VERT + len(obj.data.polygons) * BYTES_PER_POLY
+    return f, mem
+
+def cost_score(features):
+    return COST_BASE + sum(COST_WEIGHTS[k] * features.get(k, 0.0) for k in COST_WEIGHTS)
+
+def estimate_render_cost(scene):
+    """Returns a JSON-serialisable cost estimate for the current studio setup.
+    The score is scaled by the output megapixels, since render time grows with pixel count."""
+    features, mem = collect_cost_features(scene)
+    r = scene.render
+    megapixels = r.resolution_x * r.resolution_y * (r.resolution_percentage / 100.0) ** 2 / 1e6
+    score = cost_score(features) * megapixels
+    scale = scene.octane_studio_props.cost_seconds_per_unit
+    return {
+        "scene": scene.name,
+        "score": round(score, 4),
+        "memory_mb": round(mem / (1024 * 1024), 3),
+        "megapixels": round(megapixels, 3),
+        "est_seconds": round(score * scale, 2) if scale > 0 else None,
+        "features": {k: round(v, 4) for k, v in features.items()},
+    }
+
+def fit_cost_scale(samples):
+    """Least-squares seconds-per-unit from estimate records with an added "seconds" field.
+    Accepts a single record or a list; records with "features" and "megapixels" are re-scored
+    with the current weights, others use their stored "score". Malformed records are skipped."""
+    if isinstance(samples, dict): samples = [samples]
+    if not isinstance(samples, list): return 0.0
+    num = den = 0.0
+    for rec in samples:
+        if not isinstance(rec, dict): continue
+        try: seconds = float(rec["seconds"])
+        except (KeyError, TypeError, ValueError): continue
+        score = None
+        if isinstance(rec.get("features"), dict):
+            try: score = cost_score(rec["features"]) * float(rec["megapixels"])
+            except (KeyError, TypeError, ValueError): pass
+        if score is None:
+            try: score = float(rec["score"])
+            except (KeyError, TypeError, ValueError): continue
+        num += score * seconds; den += score * score
+    return num / den if den > 0 else 0.0
+
 # ------------------------------------------------------------------------
 #   DATA CLASSES
 # ------------------------------------------------------------------------
@@ -255,6 +370,10 @@ class CreativeSettings(bpy.types.PropertyGroup):
     bokeh_spread: bpy.props.FloatProperty(name="Spread Width", default=5.0)
     bokeh_power: bpy.props.FloatProperty(name="Emission Power", default=50.0)
     bokeh_base_color: bpy.props.FloatVectorProperty(name="Base Color", subtype='COLOR', default=(1, 0.5, 0.2))
+    # Per-instance variation (stored in Object Color, read by one shared material)
+    bokeh_hue_jitter: bpy.props.FloatProperty(name="Hue Jitter", default=0.0, min=0.0, max=0.5, precision=3)
+    bokeh_sat_jitter: bpy.props.FloatProperty(name="Saturation Jitter", default=0.0, min=0.0, max=1.0, precision=3)
+    bokeh_intensity_jitter: bpy.props.FloatProperty(name="Intensity Jitter", default=0.0, min=0.0, max=1.0, precision=3)
 
 class OctaneStudioProperties(bpy.types.PropertyGroup):
     ui_tab: bpy.props.EnumProperty(
@@ -290,6 +409,14 @@ class OctaneStudioProperties(bpy.types.PropertyGroup):
     backdrop_color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', default=(0.1, 0.1, 0.1), update=update_backdrop_material)
     backdrop_roughness: bpy.props.FloatProperty(name="Roughness", default=0.5, update=update_backdrop_material)
 
+    # Render cost estimate (0 = uncalibrated, score only)
+    cost_seconds_per_unit: bpy.props.FloatProperty(name="Seconds per Unit", default=0.0, min=0.0, precision=3, description="Render seconds per cost unit, fitted from real render timings")
+
+    # Style preview grid
+    preview_rotation_steps: bpy.props.IntProperty(name="Rotation Steps", default=4, min=1, max=12, description="Group rotation steps rendered per style")
+    preview_workers: bpy.props.IntProperty(name="Workers", default=2, min=1, max=16, description="Background Blender processes used to render previews")
+    preview_cache_mb: bpy.props.IntProperty(name="Cache Size (MB)", default=64, min=1, max=4096, description="On-disk preview cache limit, least recently used thumbnails are evicted first")
+
 # ------------------------------------------------------------------------
 #   OPERATORS
 # ------------------------------------------------------------------------
@@ -337,6 +464,18 @@ class OCTANESTUDIO_OT_AddAtmosphere(bpy.types.Operator):
         if 'Medium' in uni.inputs: nt.links.new(vol.outputs[0], uni.inputs['Medium'])
         return {'FINISHED'}
 
+def jitter_bokeh_colors(props, count):
+    """Returns a flat RGBA list with hue/saturation/intensity jitter around the base color."""
+    h, s, v = colorsys.rgb_to_hsv(*props.bokeh_base_color)
+    flat = []
+    for _ in range(count):
+        jh = (h + (random.random() - 0.5) * 2.0 * props.bokeh_hue_jitter) % 1.0
+        js = min(max(s + (random.random() - 0.5) * 2.0 * props.bokeh_sat_jitter, 0.0), 1.0)
+        jv = max(v * (1.0 + (random.random() - 0.5) * 2.0 * props.bokeh_intensity_jitter), 0.0)
+        flat.extend(colorsys.hsv_to_rgb(jh, js, jv))
+        flat.append(1.0)
+    return flat
+
 class OCTANESTUDIO_OT_CreateBokeh(bpy.types.Operator):
     bl_idname = "octanestudio.create_bokeh"
     bl_label = "Generate Bokeh"
@@ -352,10 +491,15 @@ class OCTANESTUDIO_OT_CreateBokeh(bpy.types.Operator):
         out = nt.nodes.new('ShaderNodeOutputMaterial')
         diff = nt.nodes.new('OctaneDiffuseMaterial')
         emit = nt.nodes.new('OctaneTextureEmission')
-        rgb = nt.nodes.new('OctaneRGBColor')
-        rgb.a_value = Color(props.bokeh_base_color)
+        # One shared graph: the instance color texture reads each sphere's Object Color,
+        # so color variety does not need a material per bokeh element.
+        try: color_src = nt.nodes.new('OctaneInstanceColor')
+        except RuntimeError:
+            self.report({'WARNING'}, "Octane Instance Color node unavailable: per-instance jitter is inactive")
+            color_src = nt.nodes.new('OctaneRGBColor')
+            color_src.a_value = Color(props.bokeh_base_color)
         emit.inputs['Power'].default_value = props.bokeh_power
-        nt.links.new(rgb.outputs[0], emit.inputs[0])
+        nt.links.new(color_src.outputs[0], emit.inputs[0])
         
         emit_socket = None
         for s in diff.inputs:
@@ -382,6 +526,9 @@ class OCTANESTUDIO_OT_CreateBokeh(bpy.types.Operator):
             if obj.users_collection:
                 for c in obj.users_collection: c.objects.unlink(obj)
             col.objects.link(obj)
+
+        # Write all per-instance colors in one bulk call
+        col.objects.foreach_set("color", jitter_bokeh_colors(props, len(col.objects)))
         return {'FINISHED'}
 
 class OCTANESTUDIO_OT_StudioBlack(bpy.types.Operator):
@@ -512,18 +659,67 @@ class OCTANESTUDIO_OT_ResetValues(bpy.types.Operator):
         update_all_lights(self, context)
         return {'FINISHED'}
 
+class OCTANESTUDIO_OT_CalibrateCost(bpy.types.Operator):
+    bl_idname = "octanestudio.calibrate_cost"
+    bl_label = "Calibrate From Timings"
+    bl_description = "Fit the cost-to-seconds scale from a JSON list of recorded render timings"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        try:
+            with open(bpy.path.abspath(self.filepath)) as fh: samples = json.load(fh)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read timings: {e}")
+            return {'CANCELLED'}
+        scale = fit_cost_scale(samples)
+        if scale <= 0:
+            self.report({'WARNING'}, "No usable timing records found")
+            return {'CANCELLED'}
+        context.scene.octane_studio_props.cost_seconds_per_unit = scale
+        self.report({'INFO'}, f"Calibrated: {scale:.3f} s per unit")
+        return {'FINISHED'}
+
+class OCTANESTUDIO_OT_GeneratePreviews(bpy.types.Operator):
+    bl_idname = "octanestudio.generate_previews"
+    bl_label = "Render Style Previews"
+    bl_description = "Render thumbnails of every style and rotation step in the background (cached on disk)"
+    def execute(self, context):
+        queued = queue_style_previews(context)
+        self.report({'INFO'}, f"{queued} preview(s) rendering" if queued else "All previews cached")
+        return {'FINISHED'}
+
+class OCTANESTUDIO_OT_ApplyPreview(bpy.types.Operator):
+    bl_idname = "octanestudio.apply_preview"
+    bl_label = "Use This Setup"
+    style: bpy.props.StringProperty()
+    rotation: bpy.props.FloatProperty()
+    def execute(self, context):
+        props = context.scene.octane_studio_props
+        props.setup_type = self.style
+        props.group_rotation = self.rotation
+        if find_light_object('KEY'): create_full_setup(context, lights_only=True)
+        return {'FINISHED'}
+
 # ------------------------------------------------------------------------
 #   MAIN CREATION
 # ------------------------------------------------------------------------
 
-def create_full_setup(context):
+def create_full_setup(context, lights_only=False):
     props = context.scene.octane_studio_props
     col = get_or_create_collection()
+    target = find_lighting_target(context) # Resolve before the old lights are removed
     for obj in list(col.objects): 
+        if obj == target: continue
+        if lights_only and not obj.get("studio_role"): continue # Keep camera, backdrop and target
         if "Atmosphere" not in obj.name: # Don't delete atmosphere if regenerating lights
             bpy.data.objects.remove(obj, do_unlink=True)
     
-    target = get_lighting_target(context) 
+    if not target: target = get_lighting_target(context) 
     style = props.setup_type
     
     def build_light(role, settings):
@@ -576,6 +772,233 @@ def create_full_setup(context):
     if props.use_fill: build_light('FILL', props.fill_light)
     if props.use_rim: build_light('RIM', props.rim_light)
 
+# ------------------------------------------------------------------------
+#   STYLE PREVIEW CACHE
+# ------------------------------------------------------------------------
+
+PREVIEW_SIZE = 128
+PREVIEW_MAX_SAMPLES = 32
+PREVIEW_STYLES = ('LOW_KEY', 'BUTTERFLY', 'SPLIT')
+
+_preview_icons = None
+_preview_grid = []      # [(style, rotation, key)] shown in the CREATE tab
+_preview_queue = []     # [(style, rotation, key, snapshot_blend)] waiting for a worker
+_preview_running = []   # [(process, key)]
+_preview_failed = set()
+_preview_blend_dir = None
+
+def get_preview_cache_dir():
+    return bpy.utils.user_resource('DATAFILES', path="octane_studio_previews", create=True)
+
+def get_preview_rotations(steps):
+    rots = []
+    for i in range(steps):
+        a = i * 2.0 * math.pi / steps
+        if a > math.pi: a -= 2.0 * math.pi
+        rots.append(a)
+    return rots
+
+# UI, cache and per-cell settings; style and rotation are hashed explicitly per cell
+PREVIEW_KEY_SKIP = {'rna_type', 'ui_tab', 'expanded', 'setup_type', 'group_rotation',
+                    'preview_rotation_steps', 'preview_workers', 'preview_cache_mb', 'cost_seconds_per_unit'}
+
+def hash_node_tree(h, nt):
+    if not nt: return
+    for node in nt.nodes:
+        h.update(repr((node.name, node.bl_idname)).encode())
+        a_value = getattr(node, 'a_value', None)
+        if a_value is not None: h.update(repr(tuple(a_value)).encode())
+        for sock in node.inputs:
+            value = getattr(sock, 'default_value', None)
+            try: value = tuple(value)
+            except TypeError: pass
+            h.update(repr((sock.identifier, value)).encode())
+    for link in nt.links:
+        h.update(repr((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier)).encode())
+
+def hash_render_scene(h, context):
+    """Hashes what the worker renders: evaluated geometry, transforms, materials and the world.
+    Studio lights are skipped, they are rebuilt from the hashed properties."""
+    scene = context.scene
+    depsgraph = context.evaluated_depsgraph_get()
+    seen, materials = set(), {}
+    for inst in depsgraph.object_instances:
+        ob = inst.object
+        if ob.original.get("studio_role") or ob.original.hide_render: continue
+        h.update(repr((ob.name, ob.type)).encode())
+        h.update(array.array('f', [v for row in inst.matrix_world for v in row]).tobytes())
+        if ob.name in seen: continue
+        seen.add(ob.name)
+        h.update(repr(tuple(ob.color)).encode())
+        mats = [slot.material for slot in ob.material_slots if slot.material]
+        h.update(repr([m.name for m in mats]).encode())
+        for m in mats: materials[m.name] = m
+        if ob.type in ('MESH', 'CURVE', 'SURFACE', 'META', 'FONT'):
+            me = ob.to_mesh()
+            if me:
+                co = array.array('f', [0.0]) * (len(me.vertices) * 3)
+                me.vertices.foreach_get("co", co)
+                h.update(co.tobytes())
+            ob.to_mesh_clear()
+        elif ob.type == 'LIGHT':
+            h.update(repr((ob.data.type, ob.data.energy, tuple(ob.data.color))).encode())
+            if ob.data.use_nodes: hash_node_tree(h, ob.data.node_tree)
+        elif ob.type == 'CAMERA':
+            d = ob.data
+            h.update(repr((d.lens, d.shift_x, d.shift_y, d.dof.use_dof, d.dof.focus_distance,
+                           d.dof.focus_object.name if d.dof.focus_object else None)).encode())
+    for name in sorted(materials):
+        if materials[name].use_nodes: hash_node_tree(h, materials[name].node_tree)
+    world = scene.world
+    h.update(repr((world.name if world else None, scene.camera.name if scene.camera else None)).encode())
+    if world and world.use_nodes: hash_node_tree(h, world.node_tree)
+
+def hash_property_group(h, pg):
+    for prop in pg.bl_rna.properties:
+        ident = prop.identifier
+        if ident in PREVIEW_KEY_SKIP: continue
+        value = getattr(pg, ident)
+        if prop.type == 'POINTER':
+            if isinstance(value, bpy.types.PropertyGroup): hash_property_group(h, value)
+            else: h.update(repr((ident, value.name if value else None)).encode())
+        elif getattr(prop, 'is_array', False): h.update(repr((ident, tuple(round(v, 5) for v in value))).encode())
+        else: h.update(repr((ident, round(value, 5) if isinstance(value, float) else value)).encode())
+
+def preview_cache_key(context, style, rotation):
+    """Hash of the rendered scene, the resolved lighting target and every studio setting."""
+    h = hashlib.sha1()
+    h.update(repr((PREVIEW_SIZE, PREVIEW_MAX_SAMPLES, style, round(rotation, 5))).encode())
+    target = find_lighting_target(context)
+    h.update(repr(target.name if target else "default-target-null").encode()) # None: a null is created at a fixed spot
+    hash_property_group(h, context.scene.octane_studio_props)
+    hash_render_scene(h, context)
+    return h.hexdigest()
+
+def evict_preview_cache(max_bytes):
+    """Deletes least recently used thumbnails until the cache fits in max_bytes.
+    Thumbnails shown in the current grid are never evicted."""
+    cache_dir = get_preview_cache_dir()
+    shown = {key for _, _, key in _preview_grid}
+    entries = []
+    for name in os.listdir(cache_dir):
+        # Skip files a worker is still writing
+        if not name.endswith(".png") or name.endswith(".part.png"): continue
+        path = os.path.join(cache_dir, name)
+        try: st = os.stat(path)
+        except OSError: continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(e[1] for e in entries)
+    for mtime, size, path in sorted(entries):
+        if total <= max_bytes: break
+        key = os.path.splitext(os.path.basename(path))[0]
+        if key in shown: continue
+        try: os.remove(path)
+        except OSError: continue
+        total -= size
+        if _preview_icons is not None and key in _preview_icons: del _preview_icons[key]
+
+def load_preview_icon(key):
+    """Loads a cached thumbnail into the icon collection; touching it marks it recently used."""
+    path = os.path.join(get_preview_cache_dir(), key + ".png")
+    if not os.path.exists(path): return False
+    os.utime(path, None)
+    if key not in _preview_icons: _preview_icons.load(key, path, 'IMAGE')
+    return True
+
+def queue_style_previews(context):
+    """Fills the preview grid from the cache and queues background renders for the misses."""
+    global _preview_blend_dir
+    props = context.scene.octane_studio_props
+    _preview_grid.clear(); _preview_queue.clear(); _preview_failed.clear()
+    for style in PREVIEW_STYLES:
+        for rot in get_preview_rotations(props.preview_rotation_steps):
+            key = preview_cache_key(context, style, rot)
+            _preview_grid.append((style, rot, key))
+            if not load_preview_icon(key) and not any(k == key for _, k in _preview_running):
+                _preview_queue.append((style, rot, key))
+    if not _preview_queue: return 0
+
+    # Workers render from a snapshot so they never see later edits to this session
+    if _preview_blend_dir is None: _preview_blend_dir = tempfile.mkdtemp(prefix="octane_studio_")
+    blend = os.path.join(_preview_blend_dir, f"snapshot_{len(os.listdir(_preview_blend_dir))}.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=blend, copy=True)
+    _preview_queue[:] = [(style, rot, key, blend) for style, rot, key in _preview_queue]
+    if not bpy.app.timers.is_registered(poll_preview_workers):
+        bpy.app.timers.register(poll_preview_workers)
+    return len(_preview_queue)
+
+def poll_preview_workers():
+    global _preview_blend_dir
+    props = bpy.context.scene.octane_studio_props
+    for job in list(_preview_running):
+        proc, key = job
+        if proc.poll() is None: continue
+        _preview_running.remove(job)
+        if proc.returncode != 0 or not load_preview_icon(key): _preview_failed.add(key)
+        evict_preview_cache(props.preview_cache_mb * 1024 * 1024)
+
+    while _preview_queue and len(_preview_running) < props.preview_workers:
+        style, rot, key, blend = _preview_queue.pop(0)
+        out = os.path.join(get_preview_cache_dir(), key + ".png")
+        cmd = [bpy.app.binary_path, "-b", blend, "--python-exit-code", "1", "--python", __file__, "--",
+               "--render-preview", style, repr(rot), out]
+        _preview_running.append((subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL), key))
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D': area.tag_redraw()
+
+    if _preview_queue or _preview_running: return 0.5
+    if _preview_blend_dir:
+        shutil.rmtree(_preview_blend_dir, ignore_errors=True); _preview_blend_dir = None
+    return None
+
+def render_style_preview(style, rotation, out):
+    """Worker side: builds the rig on the snapshot and writes one small PNG."""
+    context = bpy.context
+    scene = context.scene
+    props = scene.octane_studio_props
+    props.setup_type = style
+    props.group_rotation = rotation
+    create_full_setup(context, lights_only=True)
+
+    if not scene.camera:
+        target = get_camera_focus_target(context)
+        cam_obj = bpy.data.objects.new("Preview_Cam", bpy.data.cameras.new("Preview_Cam"))
+        scene.collection.objects.link(cam_obj)
+        cam_obj.location = target.location + Vector((0, -5, 0))
+        const = cam_obj.constraints.new('TRACK_TO')
+        const.target = target; const.track_axis = 'TRACK_NEGATIVE_Z'; const.up_axis = 'UP_Y'
+        scene.camera = cam_obj
+
+    r = scene.render
+    r.resolution_x = r.resolution_y = PREVIEW_SIZE
+    r.resolution_percentage = 100
+    r.image_settings.file_format = 'PNG'
+    # Thumbnails only need a rough converge, not the scene's final-render samples
+    octane = getattr(scene, 'octane', None)
+    for attr in ('max_samples', 'max_preview_samples'):
+        if octane and hasattr(octane, attr): setattr(octane, attr, PREVIEW_MAX_SAMPLES)
+    # Write next to the final path and swap in, so the UI never loads a partial file
+    r.filepath = out + ".part.png"
+    bpy.ops.render.render(write_still=True)
+    os.replace(r.filepath, out)
+
+def stop_preview_workers():
+    global _preview_blend_dir
+    for proc, key in _preview_running:
+        if proc.poll() is None: proc.terminate()
+    _preview_running.clear(); _preview_queue.clear(); _preview_grid.clear(); _preview_failed.clear()
+    if bpy.app.timers.is_registered(poll_preview_workers):
+        bpy.app.timers.unregister(poll_preview_workers)
+    if _preview_blend_dir:
+        shutil.rmtree(_preview_blend_dir, ignore_errors=True); _preview_blend_dir = None
+
+@bpy.app.handlers.persistent
+def stop_previews_on_load(dummy):
+    # Loading a file drops the poll timer; the grid belongs to the old file anyway
+    stop_preview_workers()
+
 # ------------------------------------------------------------------------
 #   UI
 # ------------------------------------------------------------------------
@@ -608,6 +1031,24 @@ class VIEW3D_PT_OctaneStudio(bpy.types.Panel):
             row.operator("octanestudio.generate", icon='PLAY', text="Create Lighting")
             if OCTANESTUDIO_OT_Clear.poll(context): row.operator("octanestudio.clear", icon='TRASH', text="Clear")
 
+            box = layout.box()
+            box.label(text="Style Previews", icon='IMAGE_DATA')
+            row = box.row(align=True)
+            row.prop(props, "preview_rotation_steps", text="Steps")
+            row.prop(props, "preview_workers")
+            box.prop(props, "preview_cache_mb")
+            box.operator("octanestudio.generate_previews", icon='RENDER_STILL')
+            if _preview_grid:
+                steps = sum(1 for e in _preview_grid if e[0] == _preview_grid[0][0])
+                grid = box.grid_flow(columns=steps, even_columns=True, align=True)
+                for style, rot, key in _preview_grid:
+                    cell = grid.column(align=True)
+                    if key in _preview_icons: cell.template_icon(icon_value=_preview_icons[key].icon_id, scale=4)
+                    elif key in _preview_failed: cell.label(text="Failed", icon='ERROR')
+                    else: cell.label(text="Rendering...", icon='TIME')
+                    op = cell.operator("octanestudio.apply_preview", text=f"{style.title().replace('_', ' ')} {math.degrees(rot):.0f}°")
+                    op.style = style; op.rotation = rot
+
         elif props.ui_tab == 'CONTROL':
             def draw_lp(layout, title, sp):
                 box = layout.box(); row = box.row()
@@ -641,6 +1082,11 @@ class VIEW3D_PT_OctaneStudio(bpy.types.Panel):
             box.prop(props.creative, "bokeh_dist")
             box.prop(props.creative, "bokeh_spread")
             box.prop(props.creative, "bokeh_base_color")
+            col = box.column(align=True)
+            col.label(text="Per-Instance Variation", icon='COLOR')
+            col.prop(props.creative, "bokeh_hue_jitter", slider=True)
+            col.prop(props.creative, "bokeh_sat_jitter", slider=True)
+            col.prop(props.creative, "bokeh_intensity_jitter", slider=True)
             row = box.row(); row.scale_y = 1.5
             row.operator("octanestudio.create_bokeh", text="Generate Bokeh Elements", icon='SHADING_RENDERED')
 
@@ -680,6 +1126,16 @@ class VIEW3D_PT_OctaneStudio(bpy.types.Panel):
             # RESTORED FEATURE
             box.operator("octanestudio.studio_black", icon='WORLD', text="Set Studio Black")
             
+            box = layout.box(); box.label(text="Render Cost Estimate", icon='TIME')
+            est = estimate_render_cost(context.scene)
+            col = box.column(align=True)
+            col.label(text=f"Relative Cost: {est['score']:.2f}")
+            col.label(text=f"Memory: {est['memory_mb']:.2f} MB")
+            if est['est_seconds'] is not None: col.label(text=f"Estimated Time: {est['est_seconds']:.0f} s")
+            row = box.row(align=True)
+            row.prop(props, "cost_seconds_per_unit")
+            row.operator("octanestudio.calibrate_cost", text="", icon='FILEBROWSER')
+
             box = layout.box(); box.operator("octanestudio.reset_values", icon='FILE_REFRESH', text="Reset Lights")
 
 # ------------------------------------------------------------------------
@@ -689,16 +1145,65 @@ class VIEW3D_PT_OctaneStudio(bpy.types.Panel):
 classes = (LightSettings, CreativeSettings, OctaneStudioProperties, OCTANESTUDIO_OT_SetAspectRatio, 
            OCTANESTUDIO_OT_Generate, OCTANESTUDIO_OT_Clear, OCTANESTUDIO_OT_AddCamera, 
            OCTANESTUDIO_OT_AddBackdrop, OCTANESTUDIO_OT_AddAtmosphere, OCTANESTUDIO_OT_CreateBokeh, 
-           OCTANESTUDIO_OT_StudioBlack, OCTANESTUDIO_OT_ResetValues, VIEW3D_PT_OctaneStudio)
+           OCTANESTUDIO_OT_StudioBlack, OCTANESTUDIO_OT_ResetValues, OCTANESTUDIO_OT_CalibrateCost,
+           OCTANESTUDIO_OT_GeneratePreviews, OCTANESTUDIO_OT_ApplyPreview, VIEW3D_PT_OctaneStudio)
 
 def register():
+    global _preview_icons
     for cls in classes: bpy.utils.register_class(cls)
     bpy.types.Scene.octane_studio_props = bpy.props.PointerProperty(type=OctaneStudioProperties)
+    _preview_icons = bpy.utils.previews.new()
+    bpy.app.handlers.load_pre.append(stop_previews_on_load)
 
 def unregister():
+    global _preview_icons
+    if stop_previews_on_load in bpy.app.handlers.load_pre: bpy.app.handlers.load_pre.remove(stop_previews_on_load)
+    stop_preview_workers()
+    bpy.utils.previews.remove(_preview_icons); _preview_icons = None
     for cls in reversed(classes): bpy.utils.unregister_class(cls)
     del bpy.types.Scene.octane_studio_props
 
+def run_cli(argv):
+    """Pipeline entry point, e.g.:
+    blender -b shot.blend --python-exit-code 2 --python __init__.py -- --estimate-cost cost.json --calibration timings.json --max-score 40
+    Exits 1 when the score exceeds --max-score and 2 on any error. Preview workers use --render-preview STYLE ROTATION OUT."""
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if "--render-preview" in args:
+        i = args.index("--render-preview")
+        style, rotation, out = args[i + 1:i + 4]
+        render_style_preview(style, float(rotation), out)
+        return
+    if "--estimate-cost" not in args: return
+
+    def opt(name):
+        if name not in args: return None
+        i = args.index(name) + 1
+        return args[i] if i < len(args) and not args[i].startswith("--") else None
+
+    # Blender exits 0 when a --python script raises, so errors must not let the gate pass
+    try:
+        scene = bpy.context.scene
+        calib = opt("--calibration")
+        if calib:
+            with open(calib) as fh: scale = fit_cost_scale(json.load(fh))
+            if scale <= 0:
+                print(f"Octane Studio: no usable timing records in {calib}", file=sys.stderr)
+                sys.exit(2)
+            scene.octane_studio_props.cost_seconds_per_unit = scale
+        max_score = opt("--max-score")
+        if max_score is not None: max_score = float(max_score)
+        est = estimate_render_cost(scene)
+        out = opt("--estimate-cost")
+        if out:
+            with open(out, "w") as fh: json.dump(est, fh, indent=2)
+        else: print(json.dumps(est, indent=2))
+    except Exception as e:
+        print(f"Octane Studio: cost estimate failed: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if max_score is not None and est["score"] > max_score: sys.exit(1)
+
 if __name__ == "__main__":
     register()
+    run_cli(sys.argv)
     
\ No newline at end of file